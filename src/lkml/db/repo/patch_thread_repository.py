@@ -10,7 +10,7 @@ from typing import Optional
 from dataclasses import dataclass
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import delete, select, update
 
 from ..models import PatchThreadModel
 
@@ -214,6 +214,24 @@ class PatchThreadRepository:
             return True
         return False
 
+    async def delete_if_exists(self, thread_id: str) -> bool:
+        """删除 Thread 记录（单条 DELETE 语句，无需先查询）
+
+        Args:
+            thread_id: Thread ID
+
+        Returns:
+            是否删除了记录
+        """
+        result = await self.session.execute(
+            delete(PatchThreadModel).where(PatchThreadModel.thread_id == thread_id)
+        )
+        await self.session.flush()
+        if result.rowcount > 0:
+            logger.debug(f"Deleted PATCH Thread: {thread_id}")
+            return True
+        return False
+
     async def mark_as_inactive(self, thread_id: str) -> bool:
         """将 Thread 标记为不活跃
 
@@ -6,7 +6,8 @@
 
 import logging
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from .types import PatchInfo, MessageClassification
 
@@ -94,12 +95,32 @@ def parse_patch_subject(subject: str) -> PatchInfo:
     - [PATCH v5 1/4] xxx
     - [RFC PATCH v2 3/5] xxx
 
+    解析结果按 subject 缓存；调用方可能会修改返回的 PatchInfo（如 is_cover_letter），
+    因此缓存的是不可变元组，每次调用返回新的 PatchInfo 对象。
+
     Args:
         subject: 邮件主题
 
     Returns:
         PatchInfo 对象
     """
+    is_patch, version, index, total, is_cover_letter = _parse_patch_subject_fields(
+        subject
+    )
+    return PatchInfo(
+        is_patch=is_patch,
+        version=version,
+        index=index,
+        total=total,
+        is_cover_letter=is_cover_letter,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _parse_patch_subject_fields(
+    subject: str,
+) -> Tuple[bool, Optional[str], Optional[int], Optional[int], bool]:
+    """解析 PATCH 主题为 (is_patch, version, index, total, is_cover_letter) 元组"""
     info = PatchInfo()
 
     # 检查是否是 PATCH
@@ -111,17 +132,27 @@ def parse_patch_subject(subject: str) -> PatchInfo:
         "patch:"
     )  # patch: xxx
 
-    if not has_patch_keyword:
-        return info
+    if has_patch_keyword:
+        info.is_patch = True
+        _parse_bracket_content(subject, info)
 
-    info.is_patch = True
+    return (
+        info.is_patch,
+        info.version,
+        info.index,
+        info.total,
+        info.is_cover_letter,
+    )
 
+
+def _parse_bracket_content(subject: str, info: PatchInfo) -> None:
+    """从包含 PATCH 的方括号中提取版本号与序号/总数"""
     # 提取包含 PATCH 的方括号内容
     # 匹配 [xxx PATCH xxx] 格式，支持多个方括号
     # 例如: [for-linus][PATCH 0/2], [RFC PATCH], [PATCH v5 1/4]
     bracket_match = re.search(r"\[([^\]]*PATCH[^\]]*)\]", subject, re.IGNORECASE)
     if not bracket_match:
-        return info
+        return
 
     bracket_content = bracket_match.group(1)
 
@@ -138,5 +169,3 @@ def parse_patch_subject(subject: str) -> PatchInfo:
         info.index = index
         info.total = total
         info.is_cover_letter = index == 0
-
-    return info
@@ -368,6 +368,23 @@ class ThreadService:
             logger.error(f"Failed to delete thread: {e}", exc_info=True)
             return False
 
+    async def delete_if_exists(self, thread_id: str) -> bool:
+        """删除 Thread 记录（如果存在）
+
+        与 delete 不同，这里只执行一次 DELETE，不需要先查询或先标记为 inactive。
+
+        Args:
+            thread_id: Thread ID
+
+        Returns:
+            删除了记录返回 True，记录不存在或失败返回 False
+        """
+        try:
+            return await self.patch_thread_repo.delete_if_exists(thread_id)
+        except (RuntimeError, ValueError, AttributeError) as e:
+            logger.error(f"Failed to delete thread: {e}", exc_info=True)
+            return False
+
     async def mark_as_inactive(self, thread_id: str) -> bool:
         """将 Thread 标记为不活跃
 
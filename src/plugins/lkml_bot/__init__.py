@@ -82,6 +82,7 @@ from .renders.patch_card import FeishuPatchCardRenderer
 from .renders.thread.feishu_render import FeishuThreadOverviewRenderer
 from .client.discord_client import DiscordClient
 from .client.feishu_client import FeishuClient
+from .client.http_session import close_shared_http_client, open_shared_http_client
 from .multi_platform_sender import MultiPlatformPatchCardSender
 
 patch_card_renderer = PatchCardRenderer(config=plugin_config)
@@ -209,6 +210,19 @@ _setup_logging_bridge()
 driver = get_driver()
 
 
+@driver.on_startup
+async def open_http_client():
+    """在 bot 启动时创建 Discord/Feishu 客户端共用的 HTTP 连接池"""
+    open_shared_http_client()
+    logger.info("Shared HTTP client initialized")
+
+
+@driver.on_shutdown
+async def close_http_client():
+    """在 bot 关闭时释放共享 HTTP 连接池"""
+    await close_shared_http_client()
+
+
 @driver.on_startup
 async def auto_start_monitoring():
     """在 bot 启动时自动启动监控任务并初始化 vger 子系统缓存"""
@@ -12,7 +12,14 @@ from .discord_client import (
     update_message_in_thread,
     send_thread_update_notification,
 )
+from .circuit_breaker import CircuitBreaker
 from .discord_params import PatchCardParams
+from .rate_limiter import ChannelRateLimiter
+from .http_session import (
+    close_shared_http_client,
+    http_client,
+    open_shared_http_client,
+)
 from .exceptions import (
     DiscordAPIError,
     DiscordHTTPError,
@@ -29,6 +36,13 @@ __all__ = [
     "send_message_to_thread",
     "update_message_in_thread",
     "send_thread_update_notification",
+    # 共享 HTTP 客户端
+    "open_shared_http_client",
+    "close_shared_http_client",
+    "http_client",
+    # 熔断器 / 限流器
+    "CircuitBreaker",
+    "ChannelRateLimiter",
     # 参数类型
     "PatchCardParams",
     # 异常
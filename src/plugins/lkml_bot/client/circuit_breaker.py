@@ -0,0 +1,53 @@
+"""简单熔断器
+
+连续失败达到阈值后"断开"，在冷却时间内直接跳过调用；
+冷却结束后只放行一次试探调用（试探期间其他调用仍被跳过），成功则恢复，失败则重新断开。
+用于避免外部服务（如 Feishu webhook）故障时每次调用都等待超时。
+"""
+
+import time
+from typing import Optional
+
+
+class CircuitBreaker:
+    """连续失败计数熔断器（非线程安全，供单个事件循环使用）"""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """初始化熔断器
+
+        Args:
+            failure_threshold: 连续失败多少次后断开
+            reset_timeout: 断开后多少秒允许试探调用
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    def allow_request(self) -> bool:
+        """判断本次调用是否放行
+
+        闭合时总是放行；断开且冷却未结束时拒绝。冷却结束后放行一次试探调用，
+        并重新开始冷却计时，使试探结果返回前的并发调用仍被拒绝。
+
+        Returns:
+            放行返回 True，应跳过调用返回 False
+        """
+        if self._opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self._opened_at < self.reset_timeout:
+            return False
+        self._opened_at = now
+        return True
+
+    def record_success(self) -> None:
+        """记录一次成功调用，恢复闭合状态"""
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """记录一次失败调用，达到阈值（或试探失败）时断开"""
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
@@ -18,30 +18,15 @@ from lkml.feed.feed_message_classifier import parse_patch_subject
 from .exceptions import DiscordHTTPError, FormatPatchError
 from .discord_params import PatchCardParams
 from .base import PatchCardClient, ThreadClient
+from .http_session import http_client
+from .discord_limits import (
+    channel_limiter,
+    get_retry_after,
+    truncate_content,
+    truncate_description,
+)
 from ..renders.types import DiscordRenderedPatchCard, DiscordRenderedThreadOverview
 
-# Discord embed description 限制为 4096 字符
-DISCORD_EMBED_DESCRIPTION_MAX_LENGTH = 4096
-# Discord content 限制为 2000 字符
-DISCORD_CONTENT_MAX_LENGTH = 2000
-
-
-def truncate_description(description: str) -> str:
-    """截断描述以符合 Discord embed 限制
-
-    Args:
-        description: 原始描述
-
-    Returns:
-        截断后的描述
-    """
-    if len(description) > DISCORD_EMBED_DESCRIPTION_MAX_LENGTH:
-        logger.warning(
-            f"Description too long ({len(description)} chars), truncating to {DISCORD_EMBED_DESCRIPTION_MAX_LENGTH}"
-        )
-        description = description[:4093] + "..."
-    return description
-
 
 async def send_discord_embed(
     config,
@@ -84,7 +69,7 @@ async def send_discord_embed(
 
     # 重试逻辑（处理 rate limit）
     for attempt in range(max_retries):
-        async with httpx.AsyncClient() as client:
+        async with http_client() as client:
             try:
                 response = await client.post(
                     f"https://discord.com/api/v10/channels/{config.platform_channel_id}/messages",
@@ -103,7 +88,7 @@ async def send_discord_embed(
 
                 # Discord rate limit (429)
                 if response.status_code == 429:
-                    retry_after = response.json().get("retry_after", 1.0)
+                    retry_after = get_retry_after(response)
                     logger.warning(
                         f"Discord rate limit hit (429), retry after {retry_after}s "
                         f"(attempt {attempt + 1}/{max_retries})"
@@ -235,7 +220,7 @@ async def _update_discord_message(config, series_patch_card, embed: Dict) -> Non
     message_data = {"embeds": [embed]}
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with http_client() as client:
             channel_id = series_patch_card.platform_channel_id
             message_id = series_patch_card.platform_message_id
             url = f"https://discord.com/api/v10/channels/{channel_id}/messages/{message_id}"
@@ -388,7 +373,7 @@ async def _create_thread_request(
         "auto_archive_duration": 10080,  # 7 天后自动归档
     }
 
-    async with httpx.AsyncClient() as client:
+    async with http_client() as client:
         channel_id = config.platform_channel_id
         url = f"https://discord.com/api/v10/channels/{channel_id}/messages/{message_id}/threads"
         response = await client.post(
@@ -470,7 +455,7 @@ async def get_existing_thread_id(config, message_id: str) -> Optional[str]:
             "Authorization": f"Bot {config.discord_bot_token}",
         }
 
-        async with httpx.AsyncClient() as client:
+        async with http_client() as client:
             # 方法1: 获取消息对象，检查是否有 thread 字段
             response = await client.get(
                 f"https://discord.com/api/v10/channels/{config.platform_channel_id}/messages/{message_id}",
@@ -541,7 +526,7 @@ async def send_thread_exists_error(  # pylint: disable=unused-argument
             "footer": {"text": "LKML Bot"},
         }
 
-        async with httpx.AsyncClient() as client:
+        async with http_client() as client:
             response = await client.post(
                 f"https://discord.com/api/v10/channels/{config.platform_channel_id}/messages",
                 json={"embeds": [error_embed]},
@@ -590,7 +575,7 @@ async def _check_thread_request(config, thread_id: str) -> bool:
         "Authorization": f"Bot {config.discord_bot_token}",
     }
 
-    async with httpx.AsyncClient() as client:
+    async with http_client() as client:
         response = await client.get(
             f"https://discord.com/api/v10/channels/{thread_id}",
             headers=headers,
@@ -668,7 +653,7 @@ async def send_thread_update_notification(
 
         message_data = {"content": content}
 
-        async with httpx.AsyncClient() as client:
+        async with http_client() as client:
             response = await client.post(
                 f"https://discord.com/api/v10/channels/{channel_id}/messages",
                 json=message_data,
@@ -728,12 +713,7 @@ async def send_message_to_thread(
         message_data = {}
         if content:
             # Discord content 限制为 2000 字符
-            if len(content) > DISCORD_CONTENT_MAX_LENGTH:
-                logger.warning(
-                    f"Content too long ({len(content)} chars), truncating to {DISCORD_CONTENT_MAX_LENGTH}"
-                )
-                content = content[: DISCORD_CONTENT_MAX_LENGTH - 3] + "..."
-            message_data["content"] = content
+            message_data["content"] = truncate_content(content)
         if embed:
             message_data["embeds"] = [embed]
 
@@ -742,7 +722,7 @@ async def send_message_to_thread(
 
         # 重试逻辑（处理 rate limit）
         for attempt in range(max_retries):
-            async with httpx.AsyncClient() as client:
+            async with http_client() as client:
                 try:
                     response = await client.post(
                         url,
@@ -755,16 +735,21 @@ async def send_message_to_thread(
                         result = response.json()
                         result_message_id = result.get("id")
                         logger.debug(
-                            f"Sent message to thread {thread_id}, message_id={result_message_id}"
+                            "Sent message to thread {}, message_id={}",
+                            thread_id,
+                            result_message_id,
                         )
                         break
 
                     # Discord rate limit (429)
                     if response.status_code == 429:
-                        retry_after = response.json().get("retry_after", 1.0)
+                        retry_after = get_retry_after(response)
                         logger.warning(
-                            f"Discord rate limit hit (429) for thread message, "
-                            f"retry after {retry_after}s (attempt {attempt + 1}/{max_retries})"
+                            "Discord rate limit hit (429) for thread message, "
+                            "retry after {}s (attempt {}/{})",
+                            retry_after,
+                            attempt + 1,
+                            max_retries,
                         )
                         if attempt < max_retries - 1:
                             await asyncio.sleep(retry_after)
@@ -773,7 +758,9 @@ async def send_message_to_thread(
                         break
 
                     logger.error(
-                        f"Failed to send message to Thread: {response.status_code}, {response.text}"
+                        "Failed to send message to Thread: {}, {}",
+                        response.status_code,
+                        response.text,
                     )
                     break
 
@@ -785,13 +772,15 @@ async def send_message_to_thread(
                     break
 
                 except (httpx.HTTPError, RuntimeError) as e:
-                    logger.error(f"Error sending message to thread: {e}", exc_info=True)
+                    logger.error(
+                        "Error sending message to thread: {}", e, exc_info=True
+                    )
                     break
 
         return result_message_id
 
     except (ValueError, KeyError) as e:
-        logger.error(f"Data error sending message to Thread: {e}", exc_info=True)
+        logger.error("Data error sending message to Thread: {}", e, exc_info=True)
         return None
 
 
@@ -823,16 +812,11 @@ async def update_message_in_thread(
         message_data = {}
         if content:
             # Discord content 限制为 2000 字符
-            if len(content) > DISCORD_CONTENT_MAX_LENGTH:
-                logger.warning(
-                    f"Content too long ({len(content)} chars), truncating to {DISCORD_CONTENT_MAX_LENGTH}"
-                )
-                content = content[: DISCORD_CONTENT_MAX_LENGTH - 3] + "..."
-            message_data["content"] = content
+            message_data["content"] = truncate_content(content)
         if embed:
             message_data["embeds"] = [embed]
 
-        async with httpx.AsyncClient() as client:
+        async with http_client() as client:
             response = await client.patch(
                 f"https://discord.com/api/v10/channels/{thread_id}/messages/{message_id}",
                 json=message_data,
@@ -841,18 +825,20 @@ async def update_message_in_thread(
             )
 
             if response.status_code in {200, 201}:
-                logger.debug(f"Updated message {message_id} in thread {thread_id}")
+                logger.debug("Updated message {} in thread {}", message_id, thread_id)
                 return True
             logger.error(
-                f"Failed to update message in Thread: {response.status_code}, {response.text}"
+                "Failed to update message in Thread: {}, {}",
+                response.status_code,
+                response.text,
             )
             return False
 
     except httpx.HTTPError as e:
-        logger.error(f"HTTP error updating message in Thread: {e}", exc_info=True)
+        logger.error("HTTP error updating message in Thread: {}", e, exc_info=True)
         return False
     except (ValueError, KeyError) as e:
-        logger.error(f"Data error updating message in Thread: {e}", exc_info=True)
+        logger.error("Data error updating message in Thread: {}", e, exc_info=True)
         return False
 
 
@@ -925,10 +911,13 @@ class DiscordClient(
             return {}
 
         sub_patch_messages: Dict[int, str] = {}
-        messages = overview_data.messages
 
-        for patch_index, message in messages.items():
+        # Discord 没有批量发送消息的接口，且同一 Thread 内的消息（封面信、[1/N]、[2/N]…）
+        # 需要按顺序出现，因此按 patch_index 排序后逐条顺序发送，不做并发；
+        # 发送节奏由按频道令牌桶控制（突发最多 5 条），429 由 send_message_to_thread 负责重试
+        for patch_index, message in sorted(overview_data.messages.items()):
             try:
+                await channel_limiter.acquire(thread_id)
                 msg_id = await send_message_to_thread(
                     self.config,
                     thread_id,
@@ -939,19 +928,22 @@ class DiscordClient(
                 if msg_id:
                     sub_patch_messages[patch_index] = msg_id
                     logger.info(
-                        f"Sent thread message for patch [{patch_index}] to thread {thread_id}, "
-                        f"message_id={msg_id}"
+                        "Sent thread message for patch [{}] to thread {}, message_id={}",
+                        patch_index,
+                        thread_id,
+                        msg_id,
                     )
                 else:
                     logger.warning(
-                        f"Failed to send thread message for patch [{patch_index}] to thread {thread_id}"
+                        "Failed to send thread message for patch [{}] to thread {}",
+                        patch_index,
+                        thread_id,
                     )
-
-                # 添加延迟以避免触发 Discord rate limit
-                await asyncio.sleep(0.2)
             except Exception as e:  # pylint: disable=broad-except
                 logger.error(
-                    f"Error sending thread message for patch [{patch_index}]: {e}",
+                    "Error sending thread message for patch [{}]: {}",
+                    patch_index,
+                    e,
                     exc_info=True,
                 )
 
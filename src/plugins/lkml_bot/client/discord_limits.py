@@ -0,0 +1,79 @@
+"""Discord API 限制相关的辅助函数
+
+集中处理 Discord 的长度限制与频率限制：
+- embed description / content 长度截断
+- 429 响应的等待时间解析
+- 按频道（含 Thread）的发送限流
+"""
+
+import httpx
+from nonebot.log import logger
+
+from .rate_limiter import ChannelRateLimiter
+
+# Discord embed description 限制为 4096 字符
+DISCORD_EMBED_DESCRIPTION_MAX_LENGTH = 4096
+# Discord content 限制为 2000 字符
+DISCORD_CONTENT_MAX_LENGTH = 2000
+
+# 按频道限流：每个频道 / Thread 每 5 秒最多 5 条消息
+channel_limiter = ChannelRateLimiter(rate=5, per=5.0)
+
+
+def truncate_description(description: str) -> str:
+    """截断描述以符合 Discord embed 限制
+
+    Args:
+        description: 原始描述
+
+    Returns:
+        截断后的描述
+    """
+    if len(description) > DISCORD_EMBED_DESCRIPTION_MAX_LENGTH:
+        logger.warning(
+            f"Description too long ({len(description)} chars), truncating to {DISCORD_EMBED_DESCRIPTION_MAX_LENGTH}"
+        )
+        description = description[:4093] + "..."
+    return description
+
+
+def truncate_content(content: str) -> str:
+    """截断消息内容以符合 Discord content 限制
+
+    Args:
+        content: 原始消息内容
+
+    Returns:
+        截断后的消息内容
+    """
+    if len(content) > DISCORD_CONTENT_MAX_LENGTH:
+        logger.warning(
+            "Content too long ({} chars), truncating to {}",
+            len(content),
+            DISCORD_CONTENT_MAX_LENGTH,
+        )
+        content = content[: DISCORD_CONTENT_MAX_LENGTH - 3] + "..."
+    return content
+
+
+def get_retry_after(response: httpx.Response) -> float:
+    """从 429 响应中解析需要等待的秒数
+
+    优先使用 Retry-After 响应头，其次使用响应体中的 retry_after 字段。
+
+    Args:
+        response: Discord 返回的 429 响应
+
+    Returns:
+        等待秒数（解析失败时为 1.0）
+    """
+    header = response.headers.get("Retry-After")
+    if header:
+        try:
+            return float(header)
+        except ValueError:
+            pass
+    try:
+        return float(response.json().get("retry_after", 1.0))
+    except (ValueError, AttributeError):
+        return 1.0
@@ -7,17 +7,42 @@
 - Thread：发送 Thread 通知卡片（Feishu 不支持真正的 Thread，用通知卡片代替）
 """
 
-from typing import Dict, Optional, Tuple
+import json
+from typing import Any, Dict, Optional, Tuple
 
 import httpx
 from nonebot.log import logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .base import PatchCardClient, ThreadClient
+from .http_session import http_client
 from ..renders.types import (
     FeishuRenderedPatchCard,
     FeishuRenderedThreadNotification,
 )
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _dumps_card(card: Dict[str, Any]) -> bytes:
+    """将卡片序列化为 JSON 请求体
+
+    安装了 orjson 时使用 orjson（原生实现，更快），否则回退到标准库 json。
+
+    Args:
+        card: 卡片字典
+
+    Returns:
+        UTF-8 编码的 JSON 字节串
+    """
+    if orjson is not None:
+        return orjson.dumps(card)  # pylint: disable=no-member
+    return json.dumps(card, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 
 class FeishuClient(
     PatchCardClient, ThreadClient
@@ -53,9 +78,12 @@ class FeishuClient(
             return None
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_client() as client:
                 response = await client.post(
-                    self.webhook_url, json=rendered_data.card, timeout=30.0
+                    self.webhook_url,
+                    content=_dumps_card(rendered_data.card),
+                    headers=_JSON_HEADERS,
+                    timeout=30.0,
                 )
                 if response.status_code not in {200, 201}:
                     logger.warning(
@@ -100,36 +128,55 @@ class FeishuClient(
         Returns:
             空字典（Feishu 不支持消息 ID 映射）
         """
+        await self.send_thread_notification(overview_data)
+        return {}
+
+    async def send_thread_notification(self, overview_data) -> bool:
+        """发送 Thread 创建通知卡片到 Feishu
+
+        与 send_thread_overview 相同，但返回是否发送成功（供熔断器判断）。
+
+        Args:
+            overview_data: FeishuRenderedThreadNotification 渲染结果
+
+        Returns:
+            成功返回 True，失败或未配置 webhook 返回 False
+        """
         if not isinstance(overview_data, FeishuRenderedThreadNotification):
             logger.error(
                 f"Invalid overview_data type: {type(overview_data)}, "
                 "expected FeishuRenderedThreadNotification"
             )
-            return {}
+            return False
 
         if not self.webhook_url:
             logger.debug(
                 "Feishu webhook URL not configured, skip sending thread notification"
             )
-            return {}
+            return False
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_client() as client:
                 response = await client.post(
-                    self.webhook_url, json=overview_data.card, timeout=30.0
+                    self.webhook_url,
+                    content=_dumps_card(overview_data.card),
+                    headers=_JSON_HEADERS,
+                    timeout=30.0,
                 )
-                if response.status_code not in {200, 201}:
-                    logger.warning(
-                        "Failed to send thread notification to Feishu: %s, %s",
-                        response.status_code,
-                        response.text,
-                    )
+                if response.status_code in {200, 201}:
+                    return True
+                logger.warning(
+                    "Failed to send thread notification to Feishu: %s, %s",
+                    response.status_code,
+                    response.text,
+                )
+                return False
         except httpx.HTTPError as e:
             logger.warning("HTTP error sending thread notification to Feishu: %s", e)
+            return False
         except (ValueError, KeyError, TypeError) as e:
             logger.warning("Data error sending thread notification to Feishu: %s", e)
-
-        return {}
+            return False
 
     async def update_thread_overview(
         self, thread_id: str, message_id: str, overview_data
@@ -158,9 +205,12 @@ class FeishuClient(
             return False
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_client() as client:
                 response = await client.post(
-                    self.webhook_url, json=overview_data.card, timeout=30.0
+                    self.webhook_url,
+                    content=_dumps_card(overview_data.card),
+                    headers=_JSON_HEADERS,
+                    timeout=30.0,
                 )
                 if response.status_code in {200, 201}:
                     return True
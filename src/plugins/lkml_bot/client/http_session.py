@@ -0,0 +1,61 @@
+"""共享 HTTP 客户端
+
+Discord / Feishu 客户端共用一个 httpx.AsyncClient，以复用连接池与 keep-alive，
+避免每次请求都重新进行 DNS 解析和 TLS 握手。
+
+共享客户端在 bot 启动时创建、关闭时释放；未初始化时（如启动前或独立脚本中）
+回退为每次请求创建临时客户端，行为与之前一致。
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import httpx
+
+# 连接池配置
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_KEEPALIVE_EXPIRY = 60.0  # 秒
+
+# 共享客户端单例
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def open_shared_http_client() -> httpx.AsyncClient:
+    """创建（或返回已存在的）共享 HTTP 客户端
+
+    Returns:
+        共享的 httpx.AsyncClient 实例
+    """
+    global _shared_client  # pylint: disable=global-statement
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            )
+        )
+    return _shared_client
+
+
+async def close_shared_http_client() -> None:
+    """关闭共享 HTTP 客户端"""
+    global _shared_client  # pylint: disable=global-statement
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+@asynccontextmanager
+async def http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """获取用于单次请求的 HTTP 客户端
+
+    优先使用共享客户端（退出时不关闭）；未初始化时创建临时客户端并在退出时关闭。
+    """
+    if _shared_client is not None and not _shared_client.is_closed:
+        yield _shared_client
+        return
+
+    async with httpx.AsyncClient() as client:
+        yield client
@@ -0,0 +1,60 @@
+"""按频道的令牌桶限流器
+
+Discord 对同一频道（含 Thread）的发消息频率有限制（约 5 条 / 5 秒）。
+每个频道一个令牌桶，令牌充足时立即放行，不足时等待到下一个令牌生成，
+替代固定的 sleep 间隔。
+"""
+
+import asyncio
+import time
+from typing import Dict, Tuple
+
+# 桶数量超过该值时清理已回满的空闲桶，避免长时间运行后无限增长
+_MAX_IDLE_BUCKETS = 1024
+
+
+class ChannelRateLimiter:
+    """按频道 ID 区分的令牌桶限流器（供单个事件循环使用）"""
+
+    def __init__(self, rate: int = 5, per: float = 5.0):
+        """初始化限流器
+
+        Args:
+            rate: 每个时间窗口允许的消息数（桶容量）
+            per: 时间窗口长度（秒）
+        """
+        self.rate = rate
+        self.per = per
+        # {channel_id: (剩余令牌数, 上次更新时间)}
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    async def acquire(self, channel_id: str) -> None:
+        """获取一个令牌，令牌不足时等待
+
+        读取与更新桶状态之间没有 await，在单个事件循环内天然原子，无需加锁。
+
+        Args:
+            channel_id: 频道或 Thread ID
+        """
+        while True:
+            now = time.monotonic()
+            tokens, last = self._buckets.get(channel_id, (float(self.rate), now))
+            tokens = min(float(self.rate), tokens + (now - last) * self.rate / self.per)
+
+            if tokens >= 1:
+                self._buckets[channel_id] = (tokens - 1, now)
+                self._prune(now)
+                return
+
+            self._buckets[channel_id] = (tokens, now)
+            await asyncio.sleep((1 - tokens) * self.per / self.rate)
+
+    def _prune(self, now: float) -> None:
+        """清理已回满（空闲超过一个窗口）的桶"""
+        if len(self._buckets) <= _MAX_IDLE_BUCKETS:
+            return
+        self._buckets = {
+            channel_id: bucket
+            for channel_id, bucket in self._buckets.items()
+            if now - bucket[1] < self.per
+        }
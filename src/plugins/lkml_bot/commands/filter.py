@@ -14,7 +14,7 @@ from lkml.db.repo import (
 )
 from lkml.service.patch_card_filter_service import PatchCardFilterService
 from ..shared import (
-    extract_command,
+    match_command,
     get_user_info,
     register_command,
     check_admin,
@@ -255,7 +255,7 @@ async def handle_filter(event: Event, message: Message = EventMessage()):
 
         text = message.extract_plain_text().strip()
 
-        command_text = extract_command(text, "/filter")
+        command_text = match_command(text, "/filter")
         if command_text is None:
             return
 
@@ -32,23 +32,19 @@ def _build_help_embed() -> tuple[str, str]:
         description_parts.append("目前没有可用命令。")
     else:
         # 分组显示：管理员命令和公开命令
-        admin_commands = [m for m in COMMAND_REGISTRY if m.get("admin_only")]
-        public_commands = [m for m in COMMAND_REGISTRY if not m.get("admin_only")]
+        admin_commands = [m for m in COMMAND_REGISTRY if m.admin_only]
+        public_commands = [m for m in COMMAND_REGISTRY if not m.admin_only]
 
         if admin_commands:
             description_parts.append("**管理员命令**")
             for meta in admin_commands:
-                usage = meta.get("usage", "")
-                desc = meta.get("description", "")
-                description_parts.append(f"• `{usage}` - {desc}")
+                description_parts.append(f"• `{meta.usage}` - {meta.description}")
             description_parts.append("")
 
         if public_commands:
             description_parts.append("**公开命令**")
             for meta in public_commands:
-                usage = meta.get("usage", "")
-                desc = meta.get("description", "")
-                description_parts.append(f"• `{usage}` - {desc}")
+                description_parts.append(f"• `{meta.usage}` - {meta.description}")
 
     return "LKML Bot 帮助", "\n".join(description_parts)
 
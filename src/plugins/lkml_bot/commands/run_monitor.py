@@ -10,7 +10,7 @@ from nonebot.rule import to_me
 from lkml.scheduler import get_scheduler
 from ..shared import (
     check_admin,
-    extract_command,
+    match_command,
     get_user_info_or_finish,
     register_command,
 )
@@ -29,7 +29,7 @@ async def handle_run_monitor(event: Event, message: Message = EventMessage()):
         logger.info(f"Run monitor command handler triggered, text: '{text}'")
 
         # 检查命令匹配
-        command_text = extract_command(text, "/run-monitor")
+        command_text = match_command(text, "/run-monitor")
         if command_text is None:
             logger.debug(
                 f"Text does not match '/run-monitor', returning. Text: '{text}'"
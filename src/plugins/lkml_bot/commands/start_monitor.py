@@ -11,7 +11,7 @@ from lkml.scheduler import get_scheduler
 from lkml.service import LKMLService
 from ..shared import (
     check_admin,
-    extract_command,
+    match_command,
     get_user_info_or_finish,
     register_command,
 )
@@ -32,7 +32,7 @@ async def handle_start_monitor(event: Event, message: Message = EventMessage()):
         logger.info(f"Start monitor command handler triggered, text: '{text}'")
 
         # 检查命令匹配
-        command_text = extract_command(text, "/start-monitor")
+        command_text = match_command(text, "/start-monitor")
         if command_text is None:
             logger.debug(
                 f"Text does not match '/start-monitor', returning. Text: '{text}'"
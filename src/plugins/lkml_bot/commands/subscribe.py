@@ -13,7 +13,7 @@ from nonebot.rule import to_me
 
 from lkml.service import LKMLService
 from ..config import get_config
-from ..shared import extract_command, get_user_info_or_finish, register_command
+from ..shared import match_command, get_user_info_or_finish, register_command
 
 # Discord 相关常量
 DISCORD_EMBED_DESCRIPTION_MAX = 4096  # Discord Embed description 最大长度
@@ -59,9 +59,7 @@ async def handle_subscribe(event: Event, message: Message = EventMessage()):
         text = message.extract_plain_text().strip()
         logger.info("Subscribe command handler triggered, text: '%s'", text)
 
-        command_text = extract_command(text, "/subscribe") or extract_command(
-            text, "/sub"
-        )
+        command_text = match_command(text, "/subscribe", "/sub")
         if command_text is None:
             logger.debug(
                 "Text does not match '/subscribe' or '/sub', returning. Text: '%s'",
@@ -444,4 +442,5 @@ register_command(
     usage="/(subscribe | sub) <subsystem...> | list | search <keyword>",
     description="订阅子系统；查看订阅列表；搜索子系统；批量订阅",
     admin_only=False,
+    aliases=("sub",),
 )
@@ -10,7 +10,7 @@ from nonebot.params import EventMessage
 from nonebot.rule import to_me
 
 from lkml.service import LKMLService
-from ..shared import extract_command, get_user_info_or_finish, register_command
+from ..shared import match_command, get_user_info_or_finish, register_command
 
 lkml_service = LKMLService()
 
@@ -26,9 +26,7 @@ async def handle_unsubscribe(event: Event, message: Message = EventMessage()):
         text = message.extract_plain_text().strip()
 
         # 检查命令匹配：同时支持 /unsubscribe 和 /unsub
-        command_text = extract_command(text, "/unsubscribe") or extract_command(
-            text, "/unsub"
-        )
+        command_text = match_command(text, "/unsubscribe", "/unsub")
         if command_text is None:
             logger.debug(
                 "Text does not match '/unsubscribe' or '/unsub', returning. "
@@ -115,4 +113,5 @@ register_command(
     usage="/(unsubscribe | unsub) <subsystem...>",
     description="取消订阅一个或多个子系统的邮件列表",
     admin_only=False,
+    aliases=("unsub",),
 )
@@ -4,13 +4,15 @@
 不需要 Interaction Endpoint，直接通过 Discord Bot 消息命令处理。
 """
 
+import asyncio
+from collections import OrderedDict
 from typing import Optional, Tuple
 
-from nonebot import on_message
+from nonebot import on_command
 from nonebot.rule import to_me
 from nonebot.adapters import Message, Event
 from nonebot.adapters.discord import MessageCreateEvent
-from nonebot.params import EventMessage
+from nonebot.params import CommandArg
 from nonebot.exception import FinishedException
 from nonebot.log import logger
 
@@ -24,10 +26,10 @@ from lkml.service import (
 from lkml.service.types import FeedMessage
 
 from ..client.discord_client import check_thread_exists
+from ..config import get_config
 
 from ..shared import (
     register_command,
-    extract_command,
     get_user_info_or_finish,
     get_patch_card_sender,
     get_thread_sender,
@@ -41,37 +43,46 @@ register_command(
     usage="/(watch | w) <message_id>",
     description="为指定的 PATCH 创建专属 Thread",
     admin_only=False,
+    aliases=("w",),
 )
 
+# 已确认存在于 Discord 的 Thread ID 缓存（LRU）{message_id_header: thread_id}
+# 用于在查询数据库的同时预先发起 Discord Thread 存在性检查
+THREAD_ID_CACHE_SIZE = 256
+_THREAD_ID_CACHE: OrderedDict[str, str] = OrderedDict()
+
 # 创建 matcher - 需要 @ 提及机器人
-# 优先级设为 50，高于 help (40)，确保优先处理
-# block=False 允许其他命令处理，在内部用 finish() 阻止传播
-WatchCmd = on_message(rule=to_me(), priority=50, block=False)
+# 由 NoneBot 的命令前缀匹配分发 /watch 与 /w，只有真正的 watch 命令才会进入处理函数
+# force_whitespace=True 要求命令与参数之间有空白，避免 "/who" 等被当作 "/w" + "ho"
+# block=True 命中后阻止低优先级的 matcher 继续处理
+WatchCmd = on_command(
+    "watch",
+    aliases={"w"},
+    rule=to_me(),
+    force_whitespace=True,
+    priority=50,
+    block=True,
+)
 
 
 # ========== 主处理函数 ==========
 
 
 @WatchCmd.handle()
-async def handle_watch(_event: Event, message: Message = EventMessage()):
+async def handle_watch(_event: Event, args: Message = CommandArg()):
     """处理 watch PATCH 命令"""
-    msg_text = message.extract_plain_text().strip()
-
-    # 快速检查是否是 watch 命令
-    if not (msg_text.startswith("/watch ") or msg_text.startswith("/w ")):
-        return
-
     # 只处理 MessageCreateEvent
     if not isinstance(_event, MessageCreateEvent):
-        logger.debug(f"[watch] Ignoring non-create event: {type(_event).__name__}")
+        logger.debug("[watch] Ignoring non-create event: {}", type(_event).__name__)
         return
 
-    logger.info(f"[watch] Received watch command: {msg_text}")
+    arg_text = args.extract_plain_text()
+    logger.info(f"[watch] Received watch command: {arg_text.strip()}")
 
     try:
         # 1. 验证命令并获取参数
         message_id_header, user_info = await _validate_command(
-            msg_text, _event, WatchCmd
+            arg_text, _event, WatchCmd
         )
         if not message_id_header or not user_info:
             return
@@ -114,21 +125,18 @@ async def handle_watch(_event: Event, message: Message = EventMessage()):
 
 
 async def _validate_command(
-    msg_text: str, event: Event, matcher
+    arg_text: str, event: Event, matcher
 ) -> Tuple[Optional[str], Optional[Tuple[str, str]]]:
     """验证命令并提取参数
 
+    Args:
+        arg_text: 命令后的参数文本（由 CommandArg 提供）
+        event: 事件对象
+        matcher: Matcher 对象
+
     Returns:
         (message_id_header, user_info) 元组，失败返回 (None, None)
     """
-    # 匹配 /watch 或 /w
-    cmd_text = extract_command(msg_text, "/watch") or extract_command(msg_text, "/w")
-    if not cmd_text:
-        logger.debug(f"[watch] Not a watch command, ignoring. Message: '{msg_text}'")
-        return None, None
-
-    logger.info(f"[watch] Processing command: {cmd_text}")
-
     # 获取用户信息
     user_info = await get_user_info_or_finish(event, matcher)
     if not user_info:
@@ -137,8 +145,13 @@ async def _validate_command(
     user_id, user_name = user_info
 
     # 解析 message_id_header 参数
-    message_id_header = _parse_message_id(cmd_text, matcher)
+    message_id_header = _parse_message_id(arg_text)
     if not message_id_header:
+        await matcher.finish(
+            "❌ 缺少参数\n\n"
+            "用法: /watch <message_id_header>\n"
+            "message_id_header 可以从 PATCH 卡片中复制"
+        )
         return None, None
 
     logger.info(f"User {user_name} ({user_id}) watching PATCH: {message_id_header}")
@@ -146,31 +159,21 @@ async def _validate_command(
     return message_id_header, user_info
 
 
-def _parse_message_id(cmd_text: str, matcher) -> Optional[str]:
-    """解析并清理 message_id_header 参数
+def _parse_message_id(arg_text: str) -> Optional[str]:
+    """清理 message_id_header 参数
 
     清理操作：
     - 去除前后空白
     - 去除换行符和制表符
     - 去除多余的空格
     """
-    parts = cmd_text.split(maxsplit=1)
-    if len(parts) < 2:
-        matcher.finish(
-            "❌ 缺少参数\n\n"
-            "用法: /watch <message_id_header>\n"
-            "message_id_header 可以从 PATCH 卡片中复制"
-        )
-        return None
-
-    # 清理输入
-    message_id = parts[1].strip()
+    message_id = arg_text.strip()
     message_id = message_id.replace("\n", "").replace("\r", "").replace("\t", "")
     message_id = " ".join(message_id.split())
 
-    logger.debug(f"[watch] Cleaned message_id_header: '{message_id}'")
+    logger.debug("[watch] Cleaned message_id_header: '{}'", message_id)
 
-    return message_id
+    return message_id or None
 
 
 # ========== PATCH 卡片处理 ==========
@@ -224,25 +227,21 @@ async def _find_or_create_patch_card(
     """
     result = None
 
-    # 1. 从 patch_cards 查找
+    # 1. 从 patch_cards 查找（只读一次，随即释放会话，避免嵌套持有连接）
     async with get_patch_card_service() as service:
         patch_card = await service.get_patch_card_with_series_data(message_id_header)
 
-        # 如果找到的是子 PATCH（有 series_message_id 且不是 cover_letter），直接查找 Cover Letter
-        if (
-            patch_card
-            and patch_card.series_message_id
-            and not patch_card.is_cover_letter
-        ):
-            logger.info(
-                f"Found sub-patch card, looking for Cover Letter: "
-                f"{patch_card.series_message_id}"
-            )
-            result = await _find_or_create_cover_letter_from_id(
-                patch_card.series_message_id, matcher
-            )
-        elif patch_card:
-            result = patch_card
+    # 如果找到的是子 PATCH（有 series_message_id 且不是 cover_letter），直接查找 Cover Letter
+    if patch_card and patch_card.series_message_id and not patch_card.is_cover_letter:
+        logger.info(
+            f"Found sub-patch card, looking for Cover Letter: "
+            f"{patch_card.series_message_id}"
+        )
+        result = await _find_or_create_cover_letter_from_id(
+            patch_card.series_message_id, matcher
+        )
+    elif patch_card:
+        result = patch_card
 
     if result:
         return result
@@ -327,12 +326,16 @@ async def _create_patch_card(feed_message, patch_info, matcher) -> Optional[Patc
     2. 保存到数据库
     """
     try:
-        from ..config import get_config
-
         config = get_config()
 
+        is_series = bool(
+            feed_message.is_series_patch or (patch_info.total and patch_info.total > 1)
+        )
+
         # 1. 构建 PatchCard 数据
-        temp_patch_card = _build_temp_patch_card(feed_message, patch_info, config)
+        temp_patch_card = _build_temp_patch_card(
+            feed_message, patch_info, config, is_series
+        )
 
         # 2. 使用统一的多平台发送器发送
         patch_card_sender = get_patch_card_sender()
@@ -359,7 +362,9 @@ async def _create_patch_card(feed_message, patch_info, matcher) -> Optional[Patc
             return None
 
         # 3. 保存到数据库
-        service_feed_message = _build_service_feed_message(feed_message, patch_info)
+        service_feed_message = _build_service_feed_message(
+            feed_message, patch_info, is_series
+        )
 
         async with get_patch_card_service() as service:
             patch_card = await service.create_patch_card(
@@ -388,7 +393,7 @@ async def _create_patch_card(feed_message, patch_info, matcher) -> Optional[Patc
         return None
 
 
-def _build_temp_patch_card(feed_message, patch_info, config):
+def _build_temp_patch_card(feed_message, patch_info, config, is_series: bool):
     """构建临时 PatchCard 用于渲染"""
     return PatchCard(
         message_id_header=feed_message.message_id_header,
@@ -399,8 +404,7 @@ def _build_temp_patch_card(feed_message, patch_info, config):
         author=feed_message.author,
         url=feed_message.url,
         expires_at=feed_message.received_at,
-        is_series_patch=feed_message.is_series_patch
-        or (patch_info.total and patch_info.total > 1),
+        is_series_patch=is_series,
         series_message_id=feed_message.series_message_id,
         patch_version=patch_info.version,
         patch_index=patch_info.index,
@@ -411,7 +415,7 @@ def _build_temp_patch_card(feed_message, patch_info, config):
     )
 
 
-def _build_service_feed_message(feed_message, patch_info):
+def _build_service_feed_message(feed_message, patch_info, is_series: bool):
     """构建 Service 层的 FeedMessage 对象"""
     return FeedMessage(
         message_id_header=feed_message.message_id_header,
@@ -422,8 +426,7 @@ def _build_service_feed_message(feed_message, patch_info):
         received_at=feed_message.received_at,
         url=feed_message.url,
         is_patch=feed_message.is_patch,
-        is_series_patch=feed_message.is_series_patch
-        or (patch_info.total and patch_info.total > 1),
+        is_series_patch=is_series,
         series_message_id=feed_message.series_message_id,
         patch_version=patch_info.version,
         patch_index=patch_info.index,
@@ -432,21 +435,6 @@ def _build_service_feed_message(feed_message, patch_info):
     )
 
 
-async def _get_cover_letter(patch_card: PatchCard) -> PatchCard:
-    """如果是系列 PATCH，获取 Cover Letter"""
-    if not patch_card.series_message_id:
-        return patch_card
-
-    async with get_patch_card_service() as service:
-        cover_letter = await service.find_by_message_id_header(
-            patch_card.series_message_id
-        )
-        if cover_letter:
-            return cover_letter
-
-    return patch_card
-
-
 # ========== Thread 处理 ==========
 
 
@@ -455,56 +443,95 @@ async def _check_existing_thread(
 ) -> Tuple[Optional[PatchThread], bool]:
     """检查现有 Thread 状态
 
+    如果缓存中有该 PATCH 上次确认过的 Thread ID，会在查询数据库的同时
+    预先发起 Discord Thread 存在性检查，使两次网络往返重叠。
+
     Returns:
         (existing_thread, should_recreate) 元组
         - existing_thread: 存在的 Thread，不存在返回 None
         - should_recreate: 是否需要重建
     """
+    message_id_header = patch_card.message_id_header
+    config = get_config()
+
+    # 预先发起 Discord 检查（基于上次确认过的 Thread ID）
+    cached_thread_id = _THREAD_ID_CACHE.get(message_id_header)
+    speculative_check = (
+        asyncio.create_task(check_thread_exists(config, cached_thread_id))
+        if cached_thread_id
+        else None
+    )
+
     # 查找 Thread 记录
-    async with get_thread_service() as service:
-        existing_thread = await service.find_by_message_id_header(
-            patch_card.message_id_header
-        )
+    try:
+        async with get_thread_service() as service:
+            existing_thread = await service.find_by_message_id_header(message_id_header)
+    except BaseException:
+        _discard_task(speculative_check)
+        raise
+
+    if not existing_thread or existing_thread.thread_id != cached_thread_id:
+        # 缓存未命中或已过期，丢弃预先发起的检查
+        _discard_task(speculative_check)
+        speculative_check = None
 
     if not existing_thread:
+        _THREAD_ID_CACHE.pop(message_id_header, None)
         return None, False
 
     # 检查是否标记为 inactive
     if not existing_thread.is_active:
         logger.info(
-            f"Found inactive Thread for PATCH {patch_card.message_id_header}, "
+            f"Found inactive Thread for PATCH {message_id_header}, "
             f"will recreate. Old Thread ID: {existing_thread.thread_id}"
         )
+        _discard_task(speculative_check)
+        _THREAD_ID_CACHE.pop(message_id_header, None)
         async with get_thread_service() as service:
-            await service.delete(existing_thread.thread_id)
+            await service.delete_if_exists(existing_thread.thread_id)
         return None, True
 
     # 验证 Discord Thread 是否真的存在
-    from ..config import get_config
-
-    config = get_config()
-    thread_exists = await check_thread_exists(config, existing_thread.thread_id)
+    if speculative_check is not None:
+        thread_exists = await speculative_check
+    else:
+        thread_exists = await check_thread_exists(config, existing_thread.thread_id)
 
     if thread_exists:
         logger.info(
             f"Thread {existing_thread.thread_id} exists in Discord "
-            f"for PATCH {patch_card.message_id_header}"
+            f"for PATCH {message_id_header}"
         )
+        _remember_thread_id(message_id_header, existing_thread.thread_id)
         return existing_thread, False
 
     # Thread 不存在，需要重建
     logger.warning(
         f"Thread {existing_thread.thread_id} marked as active but "
-        f"doesn't exist in Discord, will recreate for PATCH {patch_card.message_id_header}"
+        f"doesn't exist in Discord, will recreate for PATCH {message_id_header}"
     )
+    _THREAD_ID_CACHE.pop(message_id_header, None)
 
     async with get_thread_service() as service:
-        await service.mark_as_inactive(existing_thread.thread_id)
-        await service.delete(existing_thread.thread_id)
+        await service.delete_if_exists(existing_thread.thread_id)
 
     return None, True
 
 
+def _remember_thread_id(message_id_header: str, thread_id: str) -> None:
+    """记录已确认存在的 Thread ID，超出容量时淘汰最久未确认的条目"""
+    _THREAD_ID_CACHE[message_id_header] = thread_id
+    _THREAD_ID_CACHE.move_to_end(message_id_header)
+    if len(_THREAD_ID_CACHE) > THREAD_ID_CACHE_SIZE:
+        _THREAD_ID_CACHE.popitem(last=False)
+
+
+def _discard_task(task: Optional[asyncio.Task]) -> None:
+    """取消不再需要的预先发起的检查任务"""
+    if task is not None and not task.done():
+        task.cancel()
+
+
 async def _handle_existing_thread(existing_thread, patch_card, matcher):
     """处理已存在的 Thread"""
     logger.info(f"Thread {existing_thread.thread_id} exists in Discord, returning link")
@@ -585,6 +612,7 @@ async def _create_new_thread(patch_card: PatchCard, matcher) -> Optional[str]:
             return None
 
         logger.info(f"Created Discord Thread: {thread_name} (ID: {thread_id})")
+        _remember_thread_id(patch_card.message_id_header, thread_id)
 
         # 3. 保存 Thread 记录
         async with get_thread_service() as service:
@@ -630,14 +658,13 @@ def _build_success_message(
 ) -> str:
     """构建成功消息"""
     action = "重建" if is_recreate else "创建"
-
-    msg_lines = [
-        f"✅ Thread {action}成功\n",
-        f"Thread: <#{thread_id}>",
-        f"主题: {patch_card.subject[:100]}",
-    ]
+    message = (
+        f"✅ Thread {action}成功\n\n"
+        f"Thread: <#{thread_id}>\n"
+        f"主题: {patch_card.subject[:100]}"
+    )
 
     if patch_card.is_series_patch:
-        msg_lines.append(f"\n这是一个系列 PATCH (共 {patch_card.patch_total} 个)")
+        message += f"\n\n这是一个系列 PATCH (共 {patch_card.patch_total} 个)"
 
-    return "\n".join(msg_lines)
+    return message
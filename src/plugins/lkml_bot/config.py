@@ -3,11 +3,18 @@
 import os
 from typing import Optional
 
+from pydantic import ConfigDict
+
 from lkml.config import LKMLConfig as BaseLKMLConfig
 
 
 class PluginConfig(BaseLKMLConfig):
-    """插件层配置（扩展基础配置，添加机器人特定配置）"""
+    """插件层配置（扩展基础配置，添加机器人特定配置）
+
+    配置在启动时从环境变量构建后即不再修改，声明为 frozen 以保证运行期只读。
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     # Discord 配置（机器人特定）
     discord_webhook_url: str = ""
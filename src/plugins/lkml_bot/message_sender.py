@@ -49,14 +49,15 @@ class MessageSender:  # pylint: disable=too-few-public-methods
                 logger.info(f"No updates for {subsystem}")
                 return
 
-            # 构建消息内容（用于日志）
-            message_text = self.renderer.render_text(subsystem, update_data)
-
             # 发送到各个平台
             await self.discord_adapter.send_subsystem_update(subsystem, update_data)
 
-            # 记录日志
-            logger.info(f"Message for {subsystem}:\n{message_text}")
+            # 记录日志（渲染后的文本仅用于调试，lazy 模式下只有 DEBUG 生效时才渲染）
+            logger.opt(lazy=True).debug(
+                "Message for {}:\n{}",
+                lambda: subsystem,
+                lambda: self.renderer.render_text(subsystem, update_data),
+            )
 
             # 如果有订阅的用户，需要通知他们
             if update_data.subscribed_users:
@@ -0,0 +1,104 @@
+"""Feishu 卡片公共构件
+
+PatchCard 与 Thread 两类 Feishu 卡片共用的骨架构建函数。
+每次调用都返回新的字典，调用方可以自由修改。
+"""
+
+# 卡片标题最大长度
+FEISHU_TITLE_MAX_LENGTH = 200
+
+
+def _make_header(title: str, tag_text: str, template: str) -> dict:
+    """构建卡片 header
+
+    Args:
+        title: 标题文字
+        tag_text: 标题旁标签文字
+        template: 颜色模板（同时用作标签颜色），如 "blue"、"green"
+
+    Returns:
+        header 字典
+    """
+    return {
+        "title": {"tag": "plain_text", "content": title},
+        "subtitle": {"tag": "plain_text", "content": ""},
+        "text_tag_list": [
+            {
+                "tag": "text_tag",
+                "text": {"tag": "plain_text", "content": tag_text},
+                "color": template,
+            }
+        ],
+        "template": template,
+        "padding": "12px 8px 12px 8px",
+    }
+
+
+def _make_column_set(background_style: str, content: str) -> dict:
+    """构建单列 markdown column_set"""
+    return {
+        "tag": "column_set",
+        "flex_mode": "stretch",
+        "horizontal_spacing": "8px",
+        "horizontal_align": "left",
+        "columns": [
+            {
+                "tag": "column",
+                "width": "weighted",
+                "background_style": background_style,
+                "elements": [
+                    {
+                        "tag": "markdown",
+                        "content": content,
+                        "text_align": "left",
+                        "text_size": "normal",
+                    }
+                ],
+                "padding": "12px 12px 12px 12px",
+                "vertical_spacing": "8px",
+                "horizontal_align": "left",
+                "vertical_align": "top",
+                "weight": 1,
+            }
+        ],
+        "margin": "0px 0px 0px 0px",
+    }
+
+
+def _make_button(url: str) -> dict:
+    """构建“查看补丁详情”按钮"""
+    return {
+        "tag": "button",
+        "text": {
+            "tag": "plain_text",
+            "content": "查看补丁详情",
+        },
+        "type": "primary_filled",
+        "width": "fill",
+        "behaviors": [
+            {
+                "type": "open_url",
+                "default_url": url,
+                "pc_url": "",
+                "ios_url": "",
+                "android_url": "",
+            }
+        ],
+        "margin": "4px 0px 4px 0px",
+    }
+
+
+def _make_card(header: dict, elements: list) -> dict:
+    """组装完整的 interactive 卡片消息"""
+    return {
+        "msg_type": "interactive",
+        "card": {
+            "schema": "2.0",
+            "config": {"update_multi": True},
+            "header": header,
+            "body": {
+                "direction": "vertical",
+                "elements": elements,
+            },
+        },
+    }
@@ -6,12 +6,56 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any, Optional
 import re
 import html
 
 from lkml.feed import FeedEntry, SubsystemUpdate
 
+# 单独的 \r 统一为 \n
+_NL_TABLE = str.maketrans({"\r": "\n"})
+# 块级标签（含 <br>）：开始/结束标签都替换为换行，尽量保留段落感
+_BLOCK_TAG_RE = re.compile(
+    r"<\s*/?(?:br|p|div|section|article|header|footer|h[1-6]|pre|code|blockquote"
+    r"|ul|ol|li)[^>]*>",
+    re.IGNORECASE,
+)
+# 其他剩余标签
+_ANY_TAG_RE = re.compile(r"<[^>]+>")
+# 换行两侧的行内空白（等价于逐行 strip）
+_LINE_EDGE_SPACE_RE = re.compile(r"[^\S\n]*\n[^\S\n]*")
+# 连续空行（最多保留一个空行）
+_MULTI_NL_RE = re.compile(r"\n{3,}")
+# 邮件条目序号前缀 "**1.** " ... "**20.** "
+_ENTRY_PREFIXES = tuple(f"**{i}.** " for i in range(1, 21))
+
+
+@lru_cache(maxsize=256)
+def _clean_text_cached(raw: str) -> str:
+    """BaseTextRenderer._clean_text 的实现（按原文缓存）
+
+    同一子系统更新重新渲染时（如重试）summary 原文相同，可直接命中缓存。
+    """
+    try:
+        text = html.unescape(raw)
+        # 标准化换行（大多数邮件不含 \r，直接跳过）
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").translate(_NL_TABLE)
+
+        # 块级标签前后放换行，尽量保留段落感
+        text = _BLOCK_TAG_RE.sub("\n", text)
+
+        # 去掉剩余标签
+        text = _ANY_TAG_RE.sub("", text)
+
+        # 去除每行首尾空白，合并多空行，最多保留一个
+        text = _LINE_EDGE_SPACE_RE.sub("\n", text)
+        text = _MULTI_NL_RE.sub("\n\n", text)
+        return text.strip()
+    except (AttributeError, TypeError, ValueError):
+        return raw.strip()
+
 
 class BaseRenderer(ABC):  # pylint: disable=too-few-public-methods
     """渲染器基类
@@ -20,6 +64,8 @@ class BaseRenderer(ABC):  # pylint: disable=too-few-public-methods
     这是抽象基类，只定义核心接口方法。
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def render(
         self, subsystem: str, update_data: SubsystemUpdate
@@ -41,21 +87,26 @@ class BaseTextRenderer(BaseRenderer):
     为文本渲染提供通用方法，如格式化统计信息、邮件条目列表等。
     """
 
-    def _format_stats(self, update_data: SubsystemUpdate) -> list[str]:
+    __slots__ = ()
+
+    def _format_stats(self, update_data: SubsystemUpdate) -> str:
         """格式化统计信息
 
         Args:
             update_data: 更新数据
 
         Returns:
-            格式化的统计信息列表
+            格式化的统计信息行（以 " | " 分隔），无统计信息时返回空字符串
         """
-        stats: list[str] = []
-        if update_data.new_count > 0:
-            stats.append(f"🆕 新邮件: **{update_data.new_count}** 条")
-        if update_data.reply_count > 0:
-            stats.append(f"💬 回复: **{update_data.reply_count}** 条")
-        return stats
+        new_count = update_data.new_count
+        reply_count = update_data.reply_count
+        if new_count > 0 and reply_count > 0:
+            return f"🆕 新邮件: **{new_count}** 条 | 💬 回复: **{reply_count}** 条"
+        if new_count > 0:
+            return f"🆕 新邮件: **{new_count}** 条"
+        if reply_count > 0:
+            return f"💬 回复: **{reply_count}** 条"
+        return ""
 
     def _format_entries(
         self, entries: list[FeedEntry], display_count: int = 5
@@ -69,49 +120,52 @@ class BaseTextRenderer(BaseRenderer):
         Returns:
             格式化后的文本行列表
         """
-        lines: list[str] = []
         display_count = min(display_count, len(entries))
+        if display_count <= 0:
+            return []
 
-        if display_count > 0:
-            lines.append("**最近更新:**")
-            lines.append("")
+        def _gen():
+            yield "**最近更新:**"
+            yield ""
 
             for i, entry in enumerate(entries[:display_count], 1):
+                # 仅当非回复且为 PATCH 时展示正文节选与 Thread overview
+                entry_content = entry.content
+                is_reply = entry_content.is_reply
+                is_patch = entry_content.is_patch
+
                 # 主题（如果有链接，添加链接）
-                subject_line = f"**{i}.** "
+                prefix = (
+                    _ENTRY_PREFIXES[i - 1]
+                    if i <= len(_ENTRY_PREFIXES)
+                    else f"**{i}.** "
+                )
                 if entry.url:
-                    subject_line += f"[{entry.subject}]({entry.url})"
+                    yield f"{prefix}[{entry.subject}]({entry.url})"
                 else:
-                    subject_line += entry.subject
-                lines.append(subject_line)
+                    yield prefix + entry.subject
 
                 # 使用 _get_author 获取作者信息
                 author, email = self._get_author(entry)
 
                 # 作者信息
                 if email:
-                    author_info = f"👤 `{author}` <{email}>"
+                    yield f"👤 `{author}` <{email}>"
                 else:
-                    author_info = f"👤 `{author}`"
-                lines.append(author_info)
-
-                # 仅当非回复且为 PATCH 时展示正文节选与 Thread overview
-                is_reply = bool(getattr(entry, "is_reply", False))
-                is_patch = bool(getattr(entry, "is_patch", False))
+                    yield f"👤 `{author}`"
 
                 # 仅非回复且为 PATCH 展示正文节选
                 if (not is_reply) and is_patch:
                     excerpt = self._get_excerpt(entry, max_chars=600, max_lines=8)
                     if excerpt:
-                        for ex_line in excerpt.splitlines():
-                            lines.append(f"> {ex_line}")
-                lines.append("")
+                        yield "> " + excerpt.replace("\n", "\n> ")
+                yield ""
 
             if len(entries) > display_count:
                 remaining = len(entries) - display_count
-                lines.append(f"*...还有 {remaining} 条邮件未显示*")
+                yield f"*...还有 {remaining} 条邮件未显示*"
 
-        return lines
+        return list(_gen())
 
     def _get_author(self, entry: FeedEntry) -> tuple[str, Optional[str]]:
         """获取作者信息，返回 (author, email)
@@ -145,57 +199,7 @@ class BaseTextRenderer(BaseRenderer):
         """
         if not raw:
             return ""
-        try:
-            text = html.unescape(raw)
-            # 标准化换行
-            text = text.replace("\r\n", "\n").replace("\r", "\n")
-
-            # 块级标签前后放换行，尽量保留段落感
-            block_tags = [
-                "p",
-                "div",
-                "section",
-                "article",
-                "header",
-                "footer",
-                "h1",
-                "h2",
-                "h3",
-                "h4",
-                "h5",
-                "h6",
-                "pre",
-                "code",
-                "blockquote",
-                "ul",
-                "ol",
-                "li",
-            ]
-            for tag in ["br", "br/"]:
-                text = re.sub(rf"<\s*{tag}[^>]*>", "\n", text, flags=re.IGNORECASE)
-            for tag in block_tags:
-                # 开始/结束标签都作为换行分隔
-                text = re.sub(rf"<\s*/?{tag}[^>]*>", "\n", text, flags=re.IGNORECASE)
-
-            # 去掉剩余标签
-            text = re.sub(r"<[^>]+>", "", text)
-
-            # 去除每行首尾空白
-            lines = [ln.strip() for ln in text.split("\n")]
-            # 合并多空行，最多保留一个
-            cleaned_lines: list[str] = []
-            empty_streak = 0
-            for ln in lines:
-                if ln == "":
-                    empty_streak += 1
-                else:
-                    empty_streak = 0
-                if empty_streak <= 1:
-                    cleaned_lines.append(ln)
-            text = "\n".join(cleaned_lines).strip()
-            return text
-        except (AttributeError, TypeError, ValueError):
-            return raw.strip()
+        return _clean_text_cached(raw)
 
     def _get_excerpt(
         self, entry: FeedEntry, max_chars: int = 600, max_lines: int = 8
@@ -208,17 +212,18 @@ class BaseTextRenderer(BaseRenderer):
         if not source:
             return ""
         text = self._clean_text(source)
+        # 预先截断：最多只会用到 max_chars 个字符和 max_lines 行，
+        # 多取 256 字符 / 1 行用于判断是否被截断
+        lines = text[: max_chars + 256].splitlines()[: max_lines + 1]
+
         # 先按行裁剪，尽量保留段落语义
         out_lines: list[str] = []
         total_chars = 0
         truncated = False
-        for ln in text.splitlines():
-            if ln.strip() == "":
-                # 空行也计算一字符作为分隔
-                add_len = 1
-            else:
-                add_len = len(ln)
-            if (len(out_lines) + 1 > max_lines) or (total_chars + add_len > max_chars):
+        for ln in lines:
+            # 空行也计算一字符作为分隔
+            add_len = len(ln) if ln.strip() else 1
+            if len(out_lines) >= max_lines or total_chars + add_len > max_chars:
                 truncated = True
                 break
             out_lines.append(ln)
@@ -227,10 +232,7 @@ class BaseTextRenderer(BaseRenderer):
         result = "\n".join(out_lines).rstrip()
         if truncated:
             # 在最后一行尾部添加省略号
-            if result.endswith("\n"):
-                result = result + "…"
-            else:
-                result = result + "…"
+            result += "…"
         return result
 
     def render_text(self, subsystem: str, update_data: SubsystemUpdate) -> str:
@@ -252,7 +254,7 @@ class BaseTextRenderer(BaseRenderer):
         # 统计信息
         stats = self._format_stats(update_data)
         if stats:
-            lines.append(" | ".join(stats))
+            lines.append(stats)
             lines.append("")
 
         # 显示最近几条新邮件的摘要
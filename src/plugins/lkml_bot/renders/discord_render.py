@@ -13,6 +13,17 @@ class DiscordRenderer(BaseTextRenderer):
     将子系统更新渲染为 Discord Embed 格式，使用颜色区分不同子系统。
     """
 
+    __slots__ = ()
+
+    # 子系统颜色
+    _COLOR_MAP = {
+        "lkml": 0x5865F2,  # Discord蓝
+        "rust-for-linux": 0xCE412B,  # Rust橙色
+        "netdev": 0x3498DB,  # 蓝色
+        "dri-devel": 0xE74C3C,  # 红色
+    }
+    _DEFAULT_COLOR = 0x5865F2  # Discord蓝作为默认
+
     def render(self, subsystem: str, update_data: SubsystemUpdate) -> dict:
         """渲染为 Discord Embed 格式
 
@@ -24,26 +35,14 @@ class DiscordRenderer(BaseTextRenderer):
             Discord Embed 字典
         """
         # 设置颜色（根据子系统类型）
-        color_map = {
-            "lkml": 0x5865F2,  # Discord蓝
-            "rust-for-linux": 0xCE412B,  # Rust橙色
-            "netdev": 0x3498DB,  # 蓝色
-            "dri-devel": 0xE74C3C,  # 红色
-        }
-        color = color_map.get(subsystem, 0x5865F2)  # Discord蓝作为默认
+        color = self._COLOR_MAP.get(subsystem, self._DEFAULT_COLOR)
 
-        # 构建描述内容
-        description_parts = []
-
-        # 统计信息
+        # 构建描述内容：统计信息 + 最近几条新邮件的摘要
         stats = self._format_stats(update_data)
-        if stats:
-            description_parts.append(" | ".join(stats))
-            description_parts.append("")
-
-        # 显示最近几条新邮件的摘要
-        entry_lines = self._format_entries(update_data.entries)
-        description_parts.extend(entry_lines)
+        description_parts = [
+            *((stats, "") if stats else ()),
+            *self._format_entries(update_data.entries),
+        ]
 
         embed = {
             "title": f"📧 {subsystem.upper()} 邮件列表更新",
@@ -2,12 +2,25 @@
 
 from lkml.service import PatchCard
 
+from .._feishu_common import (
+    FEISHU_TITLE_MAX_LENGTH,
+    _make_button,
+    _make_card,
+    _make_column_set,
+    _make_header,
+)
 from ..types import FeishuRenderedPatchCard
 
+# 基础信息模板（Single Patch / Series 共用前三行）
+_SINGLE_TMPL = "• **Subsystem** ：{s}\n• **Date** ：{d}\n• **Author** ：{a}"
+_SERIES_TMPL = _SINGLE_TMPL + "\n• **Total Patches** ：{t}\n• **Received** ：{r}/{t}"
+
 
 class FeishuPatchCardRenderer:  # pylint: disable=too-few-public-methods
     """Feishu 平台 PatchCard 渲染器（只负责渲染，不负责发送）"""
 
+    __slots__ = ("config",)
+
     def __init__(self, config):
         self.config = config  # 目前未使用，保留以便未来扩展
 
@@ -20,7 +33,7 @@ class FeishuPatchCardRenderer:  # pylint: disable=too-few-public-methods
         Returns:
             FeishuRenderedPatchCard 渲染结果
         """
-        header_title = patch_card.subject[:200]
+        header_title = patch_card.subject[:FEISHU_TITLE_MAX_LENGTH]
         date_str = (
             patch_card.expires_at.strftime("%Y-%m-%d %H:%M UTC")
             if patch_card.expires_at
@@ -39,135 +52,32 @@ class FeishuPatchCardRenderer:  # pylint: disable=too-few-public-methods
             patch_card, is_series
         )
 
-        # 基础信息（Single Patch / Series 共用）
-        base_content_lines = [
-            f"• **Subsystem** ：{patch_card.subsystem_name}",
-            f"• **Date** ：{date_str}",
-            f"• **Author** ：{author_str}",
-        ]
-
-        # 只有系列 PATCH 时才显示统计信息
+        # 基础信息；只有系列 PATCH 时才显示统计信息
         if is_series:
-            total_patches = patch_card.patch_total or 0
-            base_content_lines.append(f"• **Total Patches** ：{total_patches}")
-            base_content_lines.append(f"• **Received** ：{received}/{total_patches}")
-
-        base_content = "\n".join(base_content_lines)
-
-        card = {
-            "msg_type": "interactive",
-            "card": {
-                "schema": "2.0",
-                "config": {"update_multi": True},
-                "header": {
-                    "title": {
-                        "tag": "plain_text",
-                        "content": f"{header_title}",
-                    },
-                    "subtitle": {"tag": "plain_text", "content": ""},
-                    "text_tag_list": [
-                        {
-                            "tag": "text_tag",
-                            "text": {"tag": "plain_text", "content": "新提交"},
-                            "color": "blue",
-                        }
-                    ],
-                    "template": "blue",
-                    "padding": "12px 8px 12px 8px",
-                },
-                "body": {
-                    "direction": "vertical",
-                    "elements": [],
-                },
-            },
-        }
-
-        elements = [
-            {
-                "tag": "column_set",
-                "flex_mode": "stretch",
-                "horizontal_spacing": "8px",
-                "horizontal_align": "left",
-                "columns": [
-                    {
-                        "tag": "column",
-                        "width": "weighted",
-                        "background_style": "blue-50",
-                        "elements": [
-                            {
-                                "tag": "markdown",
-                                "content": base_content,
-                                "text_align": "left",
-                                "text_size": "normal",
-                            }
-                        ],
-                        "padding": "12px 12px 12px 12px",
-                        "vertical_spacing": "8px",
-                        "horizontal_align": "left",
-                        "vertical_align": "top",
-                        "weight": 1,
-                    }
-                ],
-                "margin": "0px 0px 0px 0px",
-            }
-        ]
+            base_content = _SERIES_TMPL.format(
+                s=patch_card.subsystem_name,
+                d=date_str,
+                a=author_str,
+                t=patch_card.patch_total or 0,
+                r=received,
+            )
+        else:
+            base_content = _SINGLE_TMPL.format(
+                s=patch_card.subsystem_name, d=date_str, a=author_str
+            )
+
+        elements = [_make_column_set("blue-50", base_content)]
 
         # 只有系列 PATCH 时才添加 Series 模块
         if is_series and subpatch_md:
             elements.append(
-                {
-                    "tag": "column_set",
-                    "flex_mode": "stretch",
-                    "horizontal_spacing": "8px",
-                    "horizontal_align": "left",
-                    "columns": [
-                        {
-                            "tag": "column",
-                            "width": "weighted",
-                            "background_style": "grey-50",
-                            "elements": [
-                                {
-                                    "tag": "markdown",
-                                    "content": ("• **Series** ：\n" + subpatch_md),
-                                    "text_align": "left",
-                                    "text_size": "normal",
-                                }
-                            ],
-                            "padding": "12px 12px 12px 12px",
-                            "vertical_spacing": "8px",
-                            "horizontal_align": "left",
-                            "vertical_align": "top",
-                            "weight": 1,
-                        }
-                    ],
-                    "margin": "0px 0px 0px 0px",
-                }
+                _make_column_set("grey-50", "• **Series** ：\n" + subpatch_md)
             )
 
         # 查看详情按钮（始终存在）
-        elements.append(
-            {
-                "tag": "button",
-                "text": {
-                    "tag": "plain_text",
-                    "content": "查看补丁详情",
-                },
-                "type": "primary_filled",
-                "width": "fill",
-                "behaviors": [
-                    {
-                        "type": "open_url",
-                        "default_url": patch_card.url or "",
-                        "pc_url": "",
-                        "ios_url": "",
-                        "android_url": "",
-                    }
-                ],
-                "margin": "4px 0px 4px 0px",
-            }
-        )
+        elements.append(_make_button(patch_card.url or ""))
 
-        card["card"]["body"]["elements"] = elements
+        card = _make_card(_make_header(header_title, "新提交", "blue"), elements)
 
         return FeishuRenderedPatchCard(card=card)
 
@@ -4,16 +4,24 @@ Plugins 层渲染器：只负责渲染 Thread Overview。
 所有业务逻辑由 Service 层处理，发送由客户端处理。
 """
 
-from typing import Dict
+from collections import OrderedDict
+from typing import Dict, List
 
 from lkml.service import FeedMessage
-from lkml.service.types import (
-    ReplyMapEntry,
-    SubPatchOverviewData,
-    ThreadOverviewData,
+from lkml.service.types import ReplyMapEntry, ThreadOverviewData
+
+from ..types import (
+    DiscordRenderedThreadMessage,
+    DiscordRenderedThreadOverview,
+    SubOverviewView,
 )
 
-from ..types import DiscordRenderedThreadMessage, DiscordRenderedThreadOverview
+# 子 PATCH 渲染结果缓存的最大条目数
+RENDER_CACHE_SIZE = 256
+# 整体 Overview 渲染结果缓存的最大条目数
+OVERVIEW_CACHE_SIZE = 64
+# 预先生成的缩进字符串（按层级索引），超出范围时再临时拼接
+_INDENTS = tuple("\t" * i for i in range(64))
 
 
 class ThreadOverviewRenderer:
@@ -37,6 +45,12 @@ class ThreadOverviewRenderer:
             config: 配置对象（保留以便未来扩展）
         """
         self.config = config
+        # 子 PATCH 渲染结果缓存（LRU）：同一 PATCH 的回复集合未变化时直接复用
+        self._render_cache: OrderedDict[tuple, str] = OrderedDict()
+        # 整体 Overview 渲染结果缓存（LRU）：重试等场景下同一数据重复渲染时直接复用
+        self._overview_cache: OrderedDict[tuple, DiscordRenderedThreadOverview] = (
+            OrderedDict()
+        )
 
     def render(
         self, overview_data: ThreadOverviewData
@@ -57,37 +71,59 @@ class ThreadOverviewRenderer:
         messages: Dict[int, DiscordRenderedThreadMessage] = {}
 
         # 使用 service 层准备好的 sub_patch_overviews
-        if overview_data.sub_patch_overviews:
-            for sub_overview in overview_data.sub_patch_overviews:
-                patch = sub_overview.patch
-                patch_index = patch.patch_index
+        sub_patch_overviews = overview_data.sub_patch_overviews
+        if sub_patch_overviews:
+            # 以内容而非对象 id 作为键：id 在对象回收后可能被复用
+            cache_key = tuple(
+                (
+                    sub.patch.patch_index,
+                    sub.patch.subject,
+                    sub.patch.url,
+                    tuple(sub.reply_hierarchy.root_replies),
+                    frozenset(sub.reply_hierarchy.reply_map),
+                )
+                for sub in sub_patch_overviews
+            )
+            cached = self._overview_cache.get(cache_key)
+            if cached is not None:
+                self._overview_cache.move_to_end(cache_key)
+                return cached
+
+            for sub_overview in sub_patch_overviews:
+                patch_index = sub_overview.patch.patch_index
 
                 # 渲染子 PATCH 消息
-                patch_content = self._render_sub_patch(sub_overview)
+                patch_content = self._render_sub_patch(
+                    SubOverviewView.from_overview(sub_overview)
+                )
                 patch_content += "\n\n---\n"
 
                 messages[patch_index] = DiscordRenderedThreadMessage(
                     content=patch_content, embed=None
                 )
 
+            rendered = DiscordRenderedThreadOverview(messages=messages)
+            self._overview_cache[cache_key] = rendered
+            if len(self._overview_cache) > OVERVIEW_CACHE_SIZE:
+                self._overview_cache.popitem(last=False)
+            return rendered
+
         return DiscordRenderedThreadOverview(messages=messages)
 
-    def render_sub_patch(
-        self, sub_overview: SubPatchOverviewData
-    ) -> DiscordRenderedThreadMessage:
+    def render_sub_patch(self, view: SubOverviewView) -> DiscordRenderedThreadMessage:
         """渲染单个子 PATCH 消息（用于更新）
 
         Args:
-            sub_overview: 子 PATCH 的完整 Overview 数据
+            view: 子 PATCH 渲染视图
 
         Returns:
             DiscordRenderedThreadMessage 渲染结果
         """
-        content = self._render_sub_patch(sub_overview)
+        content = self._render_sub_patch(view)
         content += "\n\n---\n"
         return DiscordRenderedThreadMessage(content=content, embed=None)
 
-    def _render_sub_patch(self, sub_overview: SubPatchOverviewData) -> str:
+    def _render_sub_patch(self, view: SubOverviewView) -> str:
         """渲染单个子 PATCH 消息
 
         格式：
@@ -98,40 +134,57 @@ class ThreadOverviewRenderer:
         ` 时间 作者
 
         Args:
-            sub_overview: 子 PATCH 的完整 Overview 数据（由 service 层准备）
+            view: 子 PATCH 渲染视图（字段由 service 层数据提取）
 
         Returns:
             渲染后的子 PATCH 文本
         """
-        lines = []
-        patch = sub_overview.patch
-
-        lines.append(f"[{patch.subject}]({patch.url})")
-        lines.append("")  # 空行
-
         # 使用 service 层准备好的回复层级结构
-        reply_hierarchy = sub_overview.reply_hierarchy
+        reply_hierarchy = view.reply_hierarchy
         reply_map = reply_hierarchy.reply_map
         root_replies = reply_hierarchy.root_replies
 
+        # 无回复时渲染很廉价，不走缓存
+        cache_key = None
+        if reply_map:
+            cache_key = (
+                view.subject,
+                view.url,
+                tuple(root_replies),
+                frozenset(reply_map),
+            )
+            cached = self._render_cache.get(cache_key)
+            if cached is not None:
+                self._render_cache.move_to_end(cache_key)
+                return cached
+
+        # 标题 + 空行；之后每行以 "\n" 开头追加，最后一次 "".join 拼接
+        lines = [f"[{view.subject}]({view.url})\n"]
+
         if root_replies:
-            # 为该 PATCH 的每个顶层回复构建层级树
+            # 为该 PATCH 的每个顶层回复构建层级树，直接写入 lines
             for root_reply_id in root_replies:
-                if root_reply_id in reply_map:
-                    root_reply = reply_map[root_reply_id].reply
-                    reply_lines = self._format_reply_tree(
-                        root_reply, reply_map, level=0
-                    )
-                    lines.extend(reply_lines)
+                root_entry = reply_map.get(root_reply_id)
+                if root_entry is not None:
+                    self._format_reply_tree(root_entry, reply_map, 0, lines)
         else:
-            lines.append("_(No replies)_")
+            lines.append("\n_(No replies)_")
 
-        return "\n".join(lines)
+        result = "".join(lines)
+        if cache_key is not None:
+            self._render_cache[cache_key] = result
+            if len(self._render_cache) > RENDER_CACHE_SIZE:
+                self._render_cache.popitem(last=False)
+        return result
 
     def _format_reply_tree(
-        self, reply: FeedMessage, reply_map: Dict[str, ReplyMapEntry], level: int
-    ) -> list:
-        """递归格式化回复树
+        self,
+        entry: ReplyMapEntry,
+        reply_map: Dict[str, ReplyMapEntry],
+        level: int,
+        out: List[str],
+    ) -> None:
+        """格式化回复树（显式栈深度优先遍历，避免深层 Thread 递归过深）
 
         格式：
         ` 时间 作者 (邮箱)
@@ -139,36 +192,46 @@ class ThreadOverviewRenderer:
                 ` 时间 作者 (邮箱)  # level=2
 
         Args:
-            reply: 回复对象
+            entry: 起始回复的映射条目（含回复本身及其子回复 ID 列表）
             reply_map: 回复映射 {message_id: ReplyMapEntry}
             level: 层级深度（0 = 顶层）
-
-        Returns:
-            格式化后的行列表
+            out: 输出片段列表，每行以 "\n" 开头直接追加到其中
         """
-        lines = []
-
-        # 缩进：使用 tab 字符
-        indent = "\t" * level
-
-        # 格式化当前回复：` 时间 作者 (邮箱)
-        subject = reply.subject.split("] ", 1)[0] + "]"
-        reply_time = reply.received_at.strftime("%Y-%m-%d %H:%M")
-        author = reply.author.split(" (", 1)[0] if reply.author else "Unknown"
-
-        lines.append(f"{indent}\\` {reply_time} [{subject}]({reply.url}) {author}")
-
-        # 递归处理子回复
-        message_id = reply.message_id_header
-        if message_id in reply_map:
-            reply_entry = reply_map[message_id]
-            children_ids = reply_entry.children
-            for child_id in children_ids:
-                if child_id in reply_map:
-                    child_reply = reply_map[child_id].reply
-                    child_lines = self._format_reply_tree(
-                        child_reply, reply_map, level + 1
-                    )
-                    lines.extend(child_lines)
-
-        return lines
+        # 栈中直接保存映射条目，出栈时即可拿到子回复列表，无需再按 message_id 查找
+        stack = [(entry, level)]
+
+        while stack:
+            current_entry, current_level = stack.pop()
+            out.append(_format_reply_line(current_entry.reply, current_level))
+
+            # 子回复逆序入栈，保证出栈顺序与原先序遍历一致
+            for child_id in reversed(current_entry.children):
+                child_entry = reply_map.get(child_id)
+                if child_entry is not None:
+                    stack.append((child_entry, current_level + 1))
+
+
+def _format_reply_line(reply: FeedMessage, level: int) -> str:
+    """格式化单条回复行：` 时间 [主题标签](链接) 作者
+
+    Args:
+        reply: 回复对象
+        level: 层级深度（决定 tab 缩进数）
+
+    Returns:
+        以 "\n" 开头的回复行
+    """
+    # 缩进：使用 tab 字符
+    indent = _INDENTS[level] if level < len(_INDENTS) else "\t" * level
+
+    subject = reply.subject
+    tag_end = subject.find("] ")
+    subject = subject[: tag_end + 1] if tag_end >= 0 else subject + "]"
+    received_at = reply.received_at
+    reply_time = (
+        f"{received_at.year:04d}-{received_at.month:02d}-{received_at.day:02d} "
+        f"{received_at.hour:02d}:{received_at.minute:02d}"
+    )
+    author = reply.author.partition(" (")[0] if reply.author else "Unknown"
+
+    return f"\n{indent}\\` {reply_time} [{subject}]({reply.url}) {author}"
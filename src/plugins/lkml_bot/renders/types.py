@@ -6,9 +6,42 @@
 from dataclasses import dataclass
 from typing import Dict, Optional
 
+from lkml.service.types import ReplyHierarchy, SubPatchOverviewData
+
 from ..client.discord_params import PatchCardParams
 
 
+@dataclass(frozen=True)
+class SubOverviewView:
+    """子 PATCH 渲染视图
+
+    Discord / Feishu 渲染器共用的字段，从 SubPatchOverviewData 中只提取一次。
+    """
+
+    __slots__ = ("subject", "url", "reply_hierarchy")
+
+    subject: str
+    url: str
+    reply_hierarchy: ReplyHierarchy
+
+    @classmethod
+    def from_overview(cls, sub_overview: SubPatchOverviewData) -> "SubOverviewView":
+        """从子 PATCH Overview 数据构建视图
+
+        Args:
+            sub_overview: 子 PATCH 的完整 Overview 数据
+
+        Returns:
+            SubOverviewView 实例
+        """
+        patch = sub_overview.patch
+        return cls(
+            subject=patch.subject,
+            url=patch.url or "",
+            reply_hierarchy=sub_overview.reply_hierarchy,
+        )
+
+
 @dataclass
 class DiscordRenderedPatchCard:
     """Discord Patch Card 渲染结果"""
@@ -38,6 +71,8 @@ class DiscordRenderedThreadOverview:
 class FeishuRenderedPatchCard:
     """Feishu Patch Card 渲染结果"""
 
+    __slots__ = ("card",)
+
     card: Dict  # Feishu 卡片 JSON
 
 
@@ -45,4 +80,6 @@ class FeishuRenderedPatchCard:
 class FeishuRenderedThreadNotification:
     """Feishu Thread 通知卡片渲染结果"""
 
+    __slots__ = ("card",)
+
     card: Dict  # Feishu 卡片 JSON
@@ -6,8 +6,11 @@
 - 插件元数据
 """
 
-from functools import wraps
-from typing import Any, Awaitable, Callable, Optional, Tuple
+import inspect
+import re
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+from typing import Any, Awaitable, Callable, List, Optional, Pattern, Tuple
 
 from nonebot.adapters import Event
 from nonebot.exception import FinishedException
@@ -24,11 +27,37 @@ __plugin_meta__ = PluginMetadata(
 )
 
 
-# 命令注册表：各命令模块在导入时将自身的元信息注册到这里
-COMMAND_REGISTRY = []  # list of dict: {name, usage, description, admin_only}
+@dataclass(frozen=True)
+class CommandInfo:
+    """已注册命令的元信息"""
 
+    __slots__ = ("name", "usage", "description", "admin_only", "aliases")
 
-def register_command(name: str, usage: str, description: str, admin_only: bool = False):
+    name: str
+    usage: str
+    description: str
+    admin_only: bool
+    aliases: Tuple[str, ...]
+
+
+# 命令注册表：各命令模块在导入时将自身的元信息注册到这里（保持注册顺序）
+COMMAND_REGISTRY: List[CommandInfo] = []
+
+# 管理员校验尚未实现（_is_admin 恒为 True）时关闭校验，require_admin 直接返回原函数；
+# 实现真正的管理员判断后改为 False 即恢复完整校验逻辑
+_ADMIN_CHECK_DISABLED = True
+
+# 由 COMMAND_REGISTRY 构建的命令分发正则（注册新命令时失效）
+_compiled_dispatch_regex: Optional[Pattern[str]] = None
+
+
+def register_command(
+    name: str,
+    usage: str,
+    description: str,
+    admin_only: bool = False,
+    aliases: Tuple[str, ...] = (),
+):
     """注册命令元信息，供 help 命令聚合显示。
 
     参数:
@@ -36,16 +65,72 @@ def register_command(name: str, usage: str, description: str, admin_only: bool =
     - usage: 用法字符串（不含 @lkml-bot 前缀，例如 "/subscribe <subsystem>"）
     - description: 简短描述
     - admin_only: 是否仅管理员可用
+    - aliases: 命令别名（如 ("sub",)），参与命令分发匹配
     """
-
-    COMMAND_REGISTRY.append(
-        {
-            "name": name,
-            "usage": usage,
-            "description": description,
-            "admin_only": admin_only,
-        }
+    global _compiled_dispatch_regex  # pylint: disable=global-statement
+
+    info = CommandInfo(
+        name=name,
+        usage=usage,
+        description=description,
+        admin_only=admin_only,
+        aliases=tuple(aliases),
     )
+    COMMAND_REGISTRY.append(info)
+    _compiled_dispatch_regex = None
+    _dispatch_command_cached.cache_clear()
+
+
+def _get_dispatch_regex() -> Pattern[str]:
+    """获取（必要时构建）匹配所有已注册命令及别名的正则"""
+    global _compiled_dispatch_regex  # pylint: disable=global-statement
+    if _compiled_dispatch_regex is None:
+        names = sorted(
+            {n for c in COMMAND_REGISTRY for n in (c.name, *c.aliases)},
+            key=len,
+            reverse=True,
+        )
+        alternation = "|".join(re.escape("/" + n) for n in names) or "(?!)"
+        _compiled_dispatch_regex = re.compile(rf"(?:^|\s)({alternation})(?=\s|$)")
+    return _compiled_dispatch_regex
+
+
+def dispatch_command(text: str) -> Optional[Tuple[str, str]]:
+    """一次匹配出文本中的命令（所有已注册命令共用一个正则）
+
+    参数:
+        text: 原始文本
+
+    返回:
+        (command, command_text) 元组：command 为匹配到的命令（如 "/sub"），
+        command_text 为从命令开始的文本；未匹配到任何命令时返回 None
+    """
+    return _dispatch_command_cached(text.strip())
+
+
+def match_command(text: str, *commands: str) -> Optional[str]:
+    """判断文本分发到的命令是否为给定命令之一
+
+    参数:
+        text: 原始文本
+        commands: 可接受的命令（含别名），如 "/subscribe", "/sub"
+
+    返回:
+        匹配时返回从命令开始的文本，否则返回 None
+    """
+    dispatched = dispatch_command(text)
+    if dispatched is None or dispatched[0] not in commands:
+        return None
+    return dispatched[1]
+
+
+@lru_cache(maxsize=1024)
+def _dispatch_command_cached(text: str) -> Optional[Tuple[str, str]]:
+    """dispatch_command 的实现（按文本缓存，同一消息被多个命令处理器复用）"""
+    match = _get_dispatch_regex().search(text)
+    if match is None:
+        return None
+    return match.group(1), text[match.start(1) :].strip()
 
 
 def check_admin(event: Event) -> bool:
@@ -66,24 +151,25 @@ def require_admin(func: Callable[..., Awaitable[Any]]):
         # 只有管理员才能执行到这里
         await matcher.finish("管理员专用命令")
 
-    注意：被装饰的函数需要接收 event 和 matcher 参数。
+    注意：被装饰的函数需要接收名为 event 和 matcher 的参数。
     """
+    if _ADMIN_CHECK_DISABLED:
+        return func
+
+    # 装饰时确定 event / matcher 的位置参数下标，调用时直接取值
+    params = list(inspect.signature(func).parameters)
+    event_idx = params.index("event") if "event" in params else None
+    matcher_idx = params.index("matcher") if "matcher" in params else None
 
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        # 尝试找到 Event 和 Matcher
-        event = None
-        matcher = None
-
-        for arg in args:
-            if isinstance(arg, Event):
-                event = arg
-            elif hasattr(arg, "finish"):  # 通常是 Matcher
-                matcher = arg
-
-        if not event:
+        if event_idx is not None and event_idx < len(args):
+            event = args[event_idx]
+        else:
             event = kwargs.get("event")
-        if not matcher:
+        if matcher_idx is not None and matcher_idx < len(args):
+            matcher = args[matcher_idx]
+        else:
             matcher = kwargs.get("matcher")
 
         if not event or not _is_admin(event):
@@ -106,39 +192,6 @@ def _is_admin(_event: Event) -> bool:
     return True
 
 
-def extract_command(text: str, command: str) -> Optional[str]:
-    """从文本中提取命令。
-
-    参数:
-        text: 原始文本
-        command: 命令名称（如 "/start-monitor"）
-
-    返回:
-        如果找到命令，返回从命令开始的文本，否则返回 None
-
-    注意：
-        命令必须是完整的词，即命令后面必须是空格、字符串结尾或标点符号，
-        而不能是其他字符（避免 /subscribe 误匹配 /watch）
-    """
-    text = text.strip()
-
-    # 检查是否以命令开头
-    if text.startswith(command):
-        # 确保命令后面是空格或字符串结尾（完整匹配）
-        if len(text) == len(command) or text[len(command)] in (" ", "\n", "\t"):
-            return text
-
-    # 在文本中查找命令
-    idx = text.find(command)
-    if idx >= 0:
-        # 确保命令后面是空格或字符串结尾
-        end_idx = idx + len(command)
-        if end_idx == len(text) or text[end_idx] in (" ", "\n", "\t"):
-            return text[idx:].strip()
-
-    return None
-
-
 def get_user_info(event: Event) -> Tuple[str, str]:
     """从事件中提取用户ID和用户名。
 
@@ -199,6 +252,10 @@ async def get_user_info_or_finish(event: Event, matcher) -> Tuple[str, str]:
         raise FinishedException from exc
 
 
+# Bot 提及名称缓存（配置为只读单例，运行期间不变）
+_cached_mention_name: Optional[str] = None
+
+
 # 获取 Bot 提及名称的辅助函数
 def get_bot_mention_name() -> str:
     """获取 Bot 的提及名称
@@ -206,7 +263,10 @@ def get_bot_mention_name() -> str:
     Returns:
         Bot 的提及名称（如 @lkml-bot）
     """
-    return get_config().bot_mention_name
+    global _cached_mention_name  # pylint: disable=global-statement
+    if _cached_mention_name is None:
+        _cached_mention_name = get_config().bot_mention_name
+    return _cached_mention_name
 
 
 # 基础提示（头部）
@@ -0,0 +1,67 @@
+"""watch 命令匹配测试"""
+
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
+
+import nonebot  # noqa: E402
+
+nonebot.init()
+
+from nonebot.adapters.discord import Message  # noqa: E402
+from nonebot.rule import CommandRule, TrieRule  # noqa: E402
+
+from plugins.lkml_bot.commands.watch import WatchCmd  # noqa: E402
+
+
+class _FakeMessageEvent:
+    """只提供 TrieRule 解析命令前缀所需接口的最小事件"""
+
+    def __init__(self, text: str):
+        self._message = Message(text)
+
+    def get_type(self) -> str:
+        """事件类型"""
+        return "message"
+
+    def get_message(self) -> Message:
+        """事件消息"""
+        return self._message
+
+
+def _matches_watch(text: str) -> bool:
+    """判断文本是否会命中 watch 命令规则"""
+    prefix = TrieRule.get_value(None, _FakeMessageEvent(text), {})
+    command_rule = next(
+        checker.call
+        for checker in WatchCmd.rule.checkers
+        if isinstance(checker.call, CommandRule)
+    )
+    return asyncio.run(
+        command_rule(
+            prefix["command"], prefix["command_arg"], prefix["command_whitespace"]
+        )
+    )
+
+
+class WatchCommandMatchTest(unittest.TestCase):
+    """watch 命令只匹配 /watch 与 /w 本身，不匹配以其为前缀的其他单词"""
+
+    def test_matches_command_and_alias(self):
+        """命令名或别名后跟空白参数时命中"""
+        self.assertTrue(_matches_watch("/watch <abc@example.com>"))
+        self.assertTrue(_matches_watch("/w <abc@example.com>"))
+        self.assertTrue(_matches_watch("/w"))
+
+    def test_does_not_match_prefixed_words(self):
+        """以 /w 开头的其他单词不命中"""
+        self.assertFalse(_matches_watch("/who"))
+        self.assertFalse(_matches_watch("/wfoo"))
+        self.assertFalse(_matches_watch("/watchlist"))
+
+
+if __name__ == "__main__":
+    unittest.main()